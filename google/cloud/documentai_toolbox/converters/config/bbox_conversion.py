@@ -20,6 +20,12 @@ from intervaltree import intervaltree
 from google.cloud import documentai
 from google.cloud.documentai_v1.types import geometry
 
+# Pixels per unit for the supported physical bounding box units.
+_PIXEL_CONVERSION_RATES = {
+    "inch": 96,
+    "cm": 37.795,
+}
+
 
 def _midpoint_in_bpoly(
     box_a: geometry.BoundingPoly, box_b: geometry.BoundingPoly
@@ -132,23 +138,14 @@ def _convert_bbox_units(
     """
     final_coordinate = coordinate
     if input_bbox_units != "normalized":
-        if input_bbox_units == "pxl":
+        conversion_rate = _PIXEL_CONVERSION_RATES.get(input_bbox_units)
+        if input_bbox_units == "pxl" or conversion_rate:
+            if conversion_rate:
+                coordinate = _convert_to_pixels(coordinate, conversion_rate)
             if width is None:
                 final_coordinate = _normalize_coordinates(coordinate, height)
             else:
                 final_coordinate = _normalize_coordinates(coordinate, width)
-        if input_bbox_units == "inch":
-            x = _convert_to_pixels(coordinate, 96)
-            if width is None:
-                final_coordinate = _normalize_coordinates(x, height)
-            else:
-                final_coordinate = _normalize_coordinates(x, width)
-        if input_bbox_units == "cm":
-            x = _convert_to_pixels(coordinate, 37.795)
-            if width is None:
-                final_coordinate = _normalize_coordinates(x, height)
-            else:
-                final_coordinate = _normalize_coordinates(x, width)
 
     return final_coordinate * multiplier
 
@@ -170,14 +167,10 @@ def _get_multiplier(
             multiplier to use when converting bounding boxes.
 
     """
-    if input_bbox_units == "inch":
-        converted = _convert_to_pixels(external_coordinate, 96)
-        return docproto_coordinate / converted
-    elif input_bbox_units == "cm":
-        converted = _convert_to_pixels(external_coordinate, 37.795)
-        return docproto_coordinate / converted
-    else:
-        return docproto_coordinate / external_coordinate
+    conversion_rate = _PIXEL_CONVERSION_RATES.get(input_bbox_units)
+    if conversion_rate:
+        external_coordinate = _convert_to_pixels(external_coordinate, conversion_rate)
+    return docproto_coordinate / external_coordinate
 
 
 def _convert_bbox_to_docproto_bbox(block) -> geometry.BoundingPoly:
@@ -33,6 +33,9 @@ from google.cloud.documentai_toolbox.utilities import gcs_utilities
 
 from google.cloud import documentai, storage
 
+_FILE_CHECK_PATTERN = re.compile(constants.FILE_CHECK_REGEX)
+_GCS_URI_PATTERN = re.compile(r"gs://(.*?)/(.*)")
+
 
 def _get_base_ocr(
     project_id: str, location: str, processor_id: str, file_bytes: bytes, mime_type: str
@@ -88,14 +91,16 @@ def _get_entity_content(
     entity_id = 0
 
     for block in blocks:
-        docai_entity = documentai.Document.Entity()
+        # Initializing the fields in the constructor avoids a separate
+        # validation pass per field assignment.
+        docai_entity = documentai.Document.Entity(
+            type=block.type_,
+            mention_text=block.text,
+            id=str(entity_id),
+        )
         if block.confidence:
             docai_entity.confidence = block.confidence
 
-        docai_entity.type = block.type_
-        docai_entity.mention_text = block.text
-        docai_entity.id = str(entity_id)
-
         entity_id += 1
         # Generates the text anchors from bounding boxes
         if block.bounding_box:
@@ -114,13 +119,9 @@ def _get_entity_content(
 
             docai_entity.text_anchor.content = block.text
 
-            page_anchor = documentai.Document.PageAnchor()
-            page_ref = documentai.Document.PageAnchor.PageRef()
-
-            page_ref.bounding_poly = b1
-
-            page_anchor.page_refs = [page_ref]
-            docai_entity.page_anchor = page_anchor
+            docai_entity.page_anchor = documentai.Document.PageAnchor(
+                page_refs=[documentai.Document.PageAnchor.PageRef(bounding_poly=b1)]
+            )
         entities.append(docai_entity)
 
     return entities
@@ -247,8 +248,8 @@ def _get_bytes(
             if "DS_Store" in blob.name:
                 continue
             if not blob.name.endswith("/"):
-                blob_name = blob.name
-                file_name = blob_name.split("/")[-1]
+                # rpartition avoids allocating a list of every path segment.
+                file_name = blob.name.rpartition("/")[2]
                 if annotation_file_prefix in file_name:
                     annotation_blob = blob
                 elif config_file_prefix in file_name:
@@ -259,13 +260,14 @@ def _get_bytes(
         if metadata_blob and config_path:
             metadata_blob = bucket.get_blob(config_path)
 
-        print("Downloaded : %s\r" % prefix.split("/")[-1], end="")
+        prefix_name = prefix.rpartition("/")[2]
+        print("Downloaded : %s\r" % prefix_name, end="")
         return [
             annotation_blob.download_as_bytes(),
             doc_blob.download_as_bytes(),
             metadata_blob.download_as_bytes(),
-            prefix.split("/")[-1],
-            file_name.split(".")[0],
+            prefix_name,
+            file_name.partition(".")[0],
         ]
     except Exception as e:
         raise e
@@ -297,7 +299,7 @@ def _upload_file(
     bucket = storage_client.bucket(bucket_name)
     blob = bucket.blob(output_prefix)
 
-    print("Uploaded : %s\r" % output_prefix.split("/")[-1], end="")
+    print("Uploaded : %s\r" % output_prefix.rpartition("/")[2], end="")
     blob.upload_from_string(file, content_type="application/json")
 
 
@@ -328,7 +330,7 @@ def _get_files(
     downloads = []
     prev = None
     print("-------- Downloading Started --------")
-    for i, blob in enumerate(blob_list):
+    for blob in blob_list:
         if "DS_Store" in blob.name:
             continue
 
@@ -379,7 +381,9 @@ def _get_docproto_files(
     """
     did_not_convert = []
     files = {}
-    unique_types = []
+    # Keyed by entity type for O(1) membership; dicts preserve first-seen
+    # order, which keeps the returned label list deterministic.
+    unique_types = {}
     for future in f:
         blobs = future.result()
         docproto = _convert_to_docproto_with_config(
@@ -398,12 +402,11 @@ def _get_docproto_files(
             continue
 
         for entity in docproto.entities:
-            if entity.type_ not in unique_types:
-                unique_types.append(entity.type_)
+            unique_types[entity.type_] = None
 
         files[blobs[3]] = str(documentai.Document.to_json(docproto))
 
-    return files, unique_types, did_not_convert
+    return files, list(unique_types), did_not_convert
 
 
 def _upload(
@@ -422,7 +425,7 @@ def _upload(
         None.
 
     """
-    match = re.match(r"gs://(.*?)/(.*)", gcs_output_path)
+    match = _GCS_URI_PATTERN.match(gcs_output_path)
 
     if match is None:
         raise ValueError("gcs_prefix does not match accepted format")
@@ -432,7 +435,7 @@ def _upload(
     if output_prefix is None:
         output_prefix = "/"
 
-    file_check = re.match(constants.FILE_CHECK_REGEX, output_prefix)
+    file_check = _FILE_CHECK_PATTERN.match(output_prefix)
 
     if file_check:
         raise ValueError("gcs_prefix cannot contain file types")
@@ -440,9 +443,7 @@ def _upload(
     download_pool = futures.ThreadPoolExecutor(10)
     uploads = []
     print("-------- Uploading Started --------")
-    for i, key in enumerate(files):
-        op = output_prefix.split("/")
-        op.pop()
+    for key in files:
         if "config" not in key and "annotations" not in key:
             upload = download_pool.submit(
                 _upload_file,
@@ -490,7 +491,7 @@ def _convert_documents_with_config(
         None.
 
     """
-    match = re.match(r"gs://(.*?)/(.*)", gcs_input_path)
+    match = _GCS_URI_PATTERN.match(gcs_input_path)
 
     if match is None:
         raise ValueError("gcs_prefix does not match accepted format")
@@ -500,14 +501,16 @@ def _convert_documents_with_config(
     if input_prefix is None:
         input_prefix = "/"
 
-    file_check = re.match(constants.FILE_CHECK_REGEX, input_prefix)
+    file_check = _FILE_CHECK_PATTERN.match(input_prefix)
 
     if file_check:
         raise ValueError("gcs_prefix cannot contain file types")
 
     storage_client = gcs_utilities._get_storage_client(module="config-converter")
 
-    blob_list = storage_client.list_blobs(input_bucket, prefix=input_prefix)
+    blob_list = storage_client.list_blobs(
+        input_bucket, prefix=input_prefix, fields="items(name),nextPageToken"
+    )
 
     downloads = _get_files(
         blob_list=blob_list,
@@ -517,18 +520,13 @@ def _convert_documents_with_config(
         storage_client=storage_client,
     )
 
-    f, _ = futures.wait(downloads)
-
-    print("-------- Finished Downloading --------")
-
     print("-------- Converting Started --------")
 
-    files = []
-    did_not_convert = []
-    labels = []
-
+    # Consume the download futures directly instead of waiting for all of
+    # them first, so conversion of each document starts as soon as its
+    # download completes and overlaps the remaining downloads.
     files, labels, did_not_convert = _get_docproto_files(
-        f, project_id, location, processor_id
+        downloads, project_id, location, processor_id
     )
 
     print("-------- Finished Converting --------")
@@ -50,6 +50,11 @@ _BREAK_TYPE_MAP = immutabledict.immutabledict(
     }
 )
 
+# Resolved once here so the per-token loops below skip the nested
+# attribute-chain walk.
+_BREAK_TYPE_UNSPECIFIED = Document.Page.Token.DetectedBreak.Type.TYPE_UNSPECIFIED
+_BREAK_TYPE_UNKNOWN = TextAnnotation.DetectedBreak.BreakType.UNKNOWN
+
 
 ElementWithLayout = Union[
     Document.Page.Paragraph,
@@ -83,9 +88,7 @@ def _get_text_anchor_substring(text: str, text_anchor: Document.TextAnchor) -> s
 
 def _has_text_segment(layout: Document.Page.Layout) -> bool:
     """Checks if the layout has not empty text_segments."""
-    if layout.text_anchor.text_segments:
-        return True
-    return False
+    return bool(layout.text_anchor.text_segments)
 
 
 def _convert_common_info(
@@ -184,14 +187,9 @@ def _convert_document_symbol(
 
         page_info.symbol_idx += 1
     # Add the break_type to the last symbol.
-    if (
-        vision_symbols
-        and break_type != Document.Page.Token.DetectedBreak.Type.TYPE_UNSPECIFIED
-    ):
-        vision_symbols[-1].property.detected_break.type = (
-            _BREAK_TYPE_MAP[break_type]
-            if break_type in _BREAK_TYPE_MAP
-            else TextAnnotation.DetectedBreak.BreakType.UNKNOWN
+    if vision_symbols and break_type != _BREAK_TYPE_UNSPECIFIED:
+        vision_symbols[-1].property.detected_break.type = _BREAK_TYPE_MAP.get(
+            break_type, _BREAK_TYPE_UNKNOWN
         )
     return vision_symbols
 
@@ -218,11 +216,7 @@ def _convert_document_token(
         doc_tokens[page_info.token_idx].layout, cur_doc_paragraph.layout
     ):
         doc_break_type = doc_tokens[page_info.token_idx].detected_break.type
-        vision_break_type = (
-            _BREAK_TYPE_MAP[doc_break_type]
-            if doc_break_type in _BREAK_TYPE_MAP
-            else TextAnnotation.DetectedBreak.BreakType.UNKNOWN
-        )
+        vision_break_type = _BREAK_TYPE_MAP.get(doc_break_type, _BREAK_TYPE_UNKNOWN)
         vision_words.append(
             Word(
                 symbols=_convert_document_symbol(page_info, doc_break_type),
@@ -271,10 +265,7 @@ def _generate_entity_annotations(
         text_start_index = token.layout.text_anchor.text_segments[0].start_index
         text_end_index = token.layout.text_anchor.text_segments[0].end_index
         # The word in docai response contains the break text. Remove the break text.
-        if (
-            token.detected_break
-            != Document.Page.Token.DetectedBreak.Type.TYPE_UNSPECIFIED
-        ):
+        if token.detected_break != _BREAK_TYPE_UNSPECIFIED:
             text_end_index -= 1
 
         entity_annotations.append(
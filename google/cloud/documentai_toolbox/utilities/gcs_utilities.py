@@ -16,6 +16,7 @@
 """Document AI utilities."""
 import os
 import re
+from concurrent import futures
 from typing import Dict, List, Tuple
 
 from google.api_core import client_info
@@ -25,6 +26,9 @@ from google.cloud import documentai_toolbox
 
 from google.cloud.documentai_toolbox import constants
 
+_FILE_CHECK_PATTERN = re.compile(constants.FILE_CHECK_REGEX)
+_GCS_URI_PATTERN = re.compile(r"gs://(.*?)/(.*)")
+
 
 def _get_client_info(module: str = None) -> client_info.ClientInfo:
     r"""Returns a custom user agent header.
@@ -54,7 +58,9 @@ def _get_storage_client(module: str = None) -> storage.Client:
     return storage.Client(client_info=_get_client_info(module))
 
 
-def get_bytes(gcs_bucket_name: str, gcs_prefix: str) -> List[bytes]:
+def get_bytes(
+    gcs_bucket_name: str, gcs_prefix: str, storage_client: storage.Client = None
+) -> List[bytes]:
     r"""Returns a list of bytes of json files from Cloud Storage.
 
     Args:
@@ -66,24 +72,39 @@ def get_bytes(gcs_bucket_name: str, gcs_prefix: str) -> List[bytes]:
             Required. The prefix of the json files in the target_folder
 
             Format: `gs://{bucket_name}/{optional_folder}/{target_folder}/` where gcs_prefix=`{optional_folder}/{target_folder}`.
+        storage_client (storage.Client):
+            Optional. A Storage client to reuse across calls. Providing one
+            avoids re-running credential discovery and TLS setup, and shares
+            its connection pool, when downloading many prefixes.
     Returns:
         List[bytes]:
             A list of bytes.
 
     """
-    result = []
-
-    storage_client = _get_storage_client(module="get-bytes")
-    blob_list = storage_client.list_blobs(gcs_bucket_name, prefix=gcs_prefix)
-
-    for blob in blob_list:
-        if (
-            blob.name.endswith(constants.JSON_EXTENSION)
-            or blob.content_type == constants.JSON_MIMETYPE
-        ):
-            result.append(blob.download_as_bytes())
+    if not storage_client:
+        storage_client = _get_storage_client(module="get-bytes")
+    # Only the blob names and content types are read, so restrict the
+    # listing response to those fields.
+    blob_list = storage_client.list_blobs(
+        gcs_bucket_name,
+        prefix=gcs_prefix,
+        fields="items(name,contentType),nextPageToken",
+    )
 
-    return result
+    blobs_to_download = [
+        blob
+        for blob in blob_list
+        if blob.name.endswith(constants.JSON_EXTENSION)
+        or blob.content_type == constants.JSON_MIMETYPE
+    ]
+
+    # Each download is a blocking network round-trip, so fetch the blobs
+    # concurrently instead of one at a time. `executor.map` preserves the
+    # listing order of the blobs.
+    with futures.ThreadPoolExecutor(max_workers=16) as executor:
+        return list(
+            executor.map(lambda blob: blob.download_as_bytes(), blobs_to_download)
+        )
 
 
 def split_gcs_uri(gcs_uri: str) -> Tuple[str, str]:
@@ -99,7 +120,7 @@ def split_gcs_uri(gcs_uri: str) -> Tuple[str, str]:
             The Cloud Storage Bucket and Prefix.
 
     """
-    matches = re.match("gs://(.*?)/(.*)", gcs_uri)
+    matches = _GCS_URI_PATTERN.match(gcs_uri)
 
     if not matches:
         raise ValueError(
@@ -149,13 +170,15 @@ def list_gcs_document_tree(
             The paths to documents in `gs://{gcs_bucket_name}/{gcs_prefix}`.
 
     """
-    file_check = re.match(constants.FILE_CHECK_REGEX, gcs_prefix)
+    file_check = _FILE_CHECK_PATTERN.match(gcs_prefix)
 
     if file_check is not None:
         raise ValueError("gcs_prefix cannot contain file types")
 
     storage_client = _get_storage_client(module="list-document")
-    blob_list = storage_client.list_blobs(gcs_bucket_name, prefix=gcs_prefix)
+    blob_list = storage_client.list_blobs(
+        gcs_bucket_name, prefix=gcs_prefix, fields="items(name),nextPageToken"
+    )
 
     path_list: Dict[str, List[str]] = {}
 
@@ -239,7 +262,11 @@ def create_batches(
         )
 
     storage_client = _get_storage_client(module="create-batches")
-    blob_list = storage_client.list_blobs(gcs_bucket_name, prefix=gcs_prefix)
+    blob_list = storage_client.list_blobs(
+        gcs_bucket_name,
+        prefix=gcs_prefix,
+        fields="items(name,contentType,size),nextPageToken",
+    )
     batches: List[documentai.BatchDocumentsInputConfig] = []
     batch: List[documentai.GcsDocument] = []
 
@@ -43,6 +43,17 @@ from google.longrunning.operations_pb2 import GetOperationRequest, Operation
 
 from pikepdf import Pdf
 
+_FILE_CHECK_PATTERN = re.compile(constants.FILE_CHECK_REGEX)
+
+# Substitutions applied to convert a string into a BigQuery column name.
+# Precompiled once since `_bigquery_column_name` runs per form field/entity.
+_BIGQUERY_COLUMN_SUBSTITUTIONS = (
+    (re.compile(r":|;|\(|\)|\[|\]|,|\.|\?|\!|\'|\n"), ""),
+    (re.compile(r"/| "), "_"),
+    (re.compile(r"#"), "num"),
+    (re.compile(r"@"), "at"),
+)
+
 
 def _entities_from_shards(
     shards: List[documentai.Document],
@@ -112,7 +123,7 @@ def _get_shards(gcs_bucket_name: str, gcs_prefix: str) -> List[documentai.Docume
     """
     shards = []
 
-    file_check = re.match(constants.FILE_CHECK_REGEX, gcs_prefix)
+    file_check = _FILE_CHECK_PATTERN.match(gcs_prefix)
 
     if file_check is not None:
         raise ValueError("gcs_prefix cannot contain file types")
@@ -254,15 +265,8 @@ def _bigquery_column_name(input_string: str) -> str:
             The converted string.
 
     """
-    char_map: Dict[str, str] = {
-        r":|;|\(|\)|\[|\]|,|\.|\?|\!|\'|\n": "",
-        r"/| ": "_",
-        r"#": "num",
-        r"@": "at",
-    }
-
-    for key, value in char_map.items():
-        input_string = re.sub(key, value, input_string)
+    for pattern, replacement in _BIGQUERY_COLUMN_SUBSTITUTIONS:
+        input_string = pattern.sub(replacement, input_string)
 
     return input_string.lower()
 
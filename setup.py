@@ -49,6 +49,9 @@ setuptools.setup(
         "pandas >= 1.0.0, <2.0.0; python_version<'3.8'",
         "proto-plus >= 1.22.0, <2.0.0dev",
         "proto-plus >= 1.22.2, <2.0.0dev; python_version>='3.11'",
+        # protobuf >= 4.21 ships the upb backend, which parses messages an
+        # order of magnitude faster than the pure-Python implementation.
+        "protobuf >= 4.21.0, < 6.0.0dev",
         "grpc-google-iam-v1 >= 0.12.4, < 0.13dev",
         "google-cloud-bigquery >= 3.5.0, < 4.0.0dev",
         "google-cloud-documentai >= 1.2.1, < 3.0.0dev",
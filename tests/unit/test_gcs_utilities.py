@@ -59,12 +59,38 @@ def test_get_bytes(mock_storage):
         gcs_prefix="prefix",
     )
 
+    mock_storage.Client.assert_called_once()
+
     assert actual == [
         "gs://test-directory/1/test-annotations.json",
         "gs://test-directory/1/test-config.json",
     ]
 
 
+@mock.patch("google.cloud.documentai_toolbox.utilities.gcs_utilities.storage")
+def test_get_bytes_with_storage_client(mock_storage):
+    injected_client = mock.Mock()
+
+    mock_blob = mock.Mock(name=[])
+    mock_blob.name = "gs://test-directory/1/test-annotations.json"
+    mock_blob.download_as_bytes.return_value = (
+        "gs://test-directory/1/test-annotations.json"
+    )
+
+    injected_client.list_blobs.return_value = [mock_blob]
+
+    actual = gcs_utilities.get_bytes(
+        gcs_bucket_name="bucket",
+        gcs_prefix="prefix",
+        storage_client=injected_client,
+    )
+
+    mock_storage.Client.assert_not_called()
+    injected_client.list_blobs.assert_called_once()
+
+    assert actual == ["gs://test-directory/1/test-annotations.json"]
+
+
 def test_split_gcs_uri_with_valid_format():
     gcs_uri = "gs://test-bucket/test-directory/1/"
     bucket, prefix = gcs_utilities.split_gcs_uri(gcs_uri)